@@ -17,11 +17,13 @@ __author__ = ['davidharcombe@google.com (David Harcombe)']
 """Discovery Class.
 """
 
+import google.auth
 import json
 import logging
+import threading
 
 from apiclient import discovery
-from oauth2client.client import AccessTokenCredentials, GoogleCredentials
+from google_auth_httplib2 import AuthorizedHttp
 from typing import Any, Dict, List, Tuple, Mapping
 
 from classes.credentials import Credentials
@@ -29,6 +31,26 @@ from classes.services import Service
 
 
 class DiscoverService(object):
+  _local = threading.local()
+
+  @classmethod
+  def _http(cls) -> discovery.httplib2.Http:
+    """Per-thread shared transport.
+
+    httplib2 keeps its connections open per host, so handing the same Http
+    to every service built on this thread lets them share TCP/TLS sessions
+    rather than each opening its own. It's wrapped in an AuthorizedHttp per
+    service, which leaves the underlying Http untouched.
+
+    Returns:
+      http: the thread's Http object
+    """
+    if not hasattr(cls._local, 'http'):
+      cls._local.http = discovery.httplib2.Http()
+
+    return cls._local.http
+
+
   @classmethod
   def get_unknown_service(cls, credentials: Credentials, **kwargs: Mapping[str, Any]):
     """Fetch a discoverable API service.
@@ -43,15 +65,14 @@ class DiscoverService(object):
       service: a service for REST calls
     """
     if credentials:
-      credentials.get_credentials()
-      _credentials = AccessTokenCredentials(credentials.token_details['access_token'], user_agent='report2bq')
-      https = discovery.httplib2.Http()
-      auth_https = _credentials.authorize(https)
-      service = discovery.build(http=https, cache_discovery=False, **kwargs)
+      _credentials = credentials.get_credentials()
 
     else:
-      _credentials = GoogleCredentials.get_application_default()
-      service = discovery.build(credentials=_credentials, cache_discovery=False, **kwargs)
+      _credentials, _ = google.auth.default(
+        scopes=['https://www.googleapis.com/auth/cloud-platform'])
+
+    https = AuthorizedHttp(_credentials, http=cls._http())
+    service = discovery.build(http=https, cache_discovery=False, **kwargs)
 
     return service
 
@@ -18,290 +18,391 @@ __author__ = [
     'davidharcombe@google.com (David Harcombe)'
 ]
 
-import base64
 import json
 import logging
 import os
-import pprint
 import random
-import uuid
+import threading
 
 # Class Imports
-from io import StringIO
-from typing import Any, Dict, Generator, List, Mapping, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 
-from google.cloud import scheduler as scheduler
-from google.cloud.pubsub import PublisherClient
+from googleapiclient.discovery import Resource
+from googleapiclient.http import HttpRequest
 from googleapiclient.errors import HttpError
 
+from classes import Fetcher
 from classes.credentials import Credentials
 from classes.discovery import DiscoverService
-from classes.services import Service
 from classes.report_type import Type
-from classes import Fetcher
+from classes.services import Service
+
+
+def job_path(project: str, location: str, job: str) -> str:
+  """Return a fully-qualified job string."""
+  return f"projects/{project}/locations/{location}/jobs/{job}"
+
+
+def location_path(project: str, location: str) -> str:
+  """Return a fully-qualified location string."""
+  return f"projects/{project}/locations/{location}"
+
+
+def project_path(project: str) -> str:
+  """Return a fully-qualified project string."""
+  return f"projects/{project}"
 
 
 class Scheduler(Fetcher):
   """Scheduler helper
   
-  Handles the scheduler operations for Report2BQ
+  Handles the scheduler operations for Report2BQ.
+
+  This is kept identical to classes/scheduler.py apart from
+  '_get_credentials': the App Engine app is deployed on its own, so can't
+  import this one.
 
   """
 
+  def __init__(self):
+    self._locations_cache: Dict[str, List[str]] = {}
+    self._service = None
+    self._service_credentials = None
+    self._jobs_resource = None
+
+
+  def _get_credentials(self, email: str=None, project: str=None) -> Credentials:
+    # The App Engine app talks to the scheduler as its own service account
+    return None
+
+
+  def _svc(self, credentials: Credentials=None) -> Resource:
+    """Scheduler API service
+
+    Builds the discovery service on first use and hands back the same one
+    thereafter, unless a different set of credentials is supplied.
+
+    Keyword Arguments:
+        credentials {Credentials} -- credentials to authorize with (default: {None})
+
+    Returns:
+        Resource -- the Cloud Scheduler service
+    """
+    if self._service is None or credentials is not self._service_credentials:
+      self._service = DiscoverService.get_service(Service.SCHEDULER, credentials, api_key=os.environ['API_KEY'])
+      self._service_credentials = credentials
+      self._jobs_resource = None
+
+    return self._service
+
+
+  def _jobs(self, credentials: Credentials=None) -> Resource:
+    service = self._svc(credentials)
+    if self._jobs_resource is None:
+      self._jobs_resource = service.projects().locations().jobs()
+
+    return self._jobs_resource
+
+
   def process(self, args: Dict[str, Any]) -> str:
     logging.info(f'args: {args}')
 
     _action = args.get('action')
     _project = args.get('project')
     _email = args.get('email')
-    _html = args.get('html', True)
-
-    # _credentials = Credentials(
-    #   email=_email,
-    #   project=_project
-    # )
-    _credentials = None
-        
-    locations = self.list_locations(credentials=_credentials, project=_project)
-    _location = locations[-1]
-
-    if _action == 'list':
-      jobs = self.list_jobs(
-        credentials=_credentials, 
-        project=_project, 
-        location=_location, 
-        email=_email)
-      if _html:
-        result = StringIO()
-        result.writelines([f"{job['name']}: {job.get('description') or 'No description.'}<br/>" for job in jobs])
-        return result.getvalue()
-      else:
-        return jobs
-
-    elif _action == 'get':
-      (success, job) = self.get_job(
-        credentials=_credentials, 
-        project=_project,
-        location=_location,
-        job_id=args.get('job_id'))
-      return success, job
-
-    elif _action == 'delete':
-      (success, error) = self.delete_job(
-        credentials=_credentials, 
-        project=_project,
-        location=_location,
-        job_id=args.get('job_id'))
-
-      if success:
-        return 'OK'
-      else:
-        return f'ERROR!\n{error["error"]["message"]}'
-
-    elif _action == 'enable':
-      (success, error) = self.enable_job(
-        credentials=_credentials, 
-        project=_project,
-        location=_location,
-        job_id=args.get('job_id'),
-        enable=True)
-
-      if success:
-        return 'OK'
-      else:
-        return f'ERROR!\n{error["error"]["message"]}'
-
-    elif _action == 'disable':
-      (success, error) = self.enable_job(
-        credentials=_credentials, 
-        project=_project,
-        location=_location,
-        job_id=args.get('job_id'),
-        enable=False)
-
-      if success:
-        return 'OK'
-      else:
-        return f'ERROR!\n{error["error"]["message"]}'
-
-    elif _action == 'create':
-      _attrs = {
-        'email': _email,
-        'project': _project,
-        'force': str(args.get('force')),
-        'infer_schema': str(args.get('infer_schema')),
-        'append': str(args.get('append')),
-      }
 
-      if args.get('minute'):
-        minute = args.get('minute')
-      else:
-        random.seed(uuid.uuid4())
-        minute = random.randrange(0, 59)
-
-      if args.get('sa360_url'):
-        product = _type = 'sa360'
-        hour = args.get('hour') if args.get('hour') else '3'
-        action = 'fetch'
-        topic = 'report2bq-trigger'
-        _attrs.update({
-          'sa360_url': args.get('sa360_url'),
-          'type': 'sa360',
-        })
-
-      elif args.get('sa360_id'):
-        product = _type = Type.SA360_RPT.value
-        hour = args.get('hour', '*')
-        action = 'run'
-        topic = 'report-runner'
-        _attrs.update({
-          'report_id': args.get('sa360_id'),
-          'type': Type.SA360_RPT.value,
-        })
-        args['report_id'] = args.get('sa360_id')
-
-      elif args.get('adh_customer'):
-        product = _type = 'adh'
-        hour = args.get('hour') if args.get('hour') else '2'
-        action = 'run'
-        topic = 'report2bq-trigger'
-        _attrs.update({
-          'adh_customer': args.get('adh_customer'),
-          'adh_query': args.get('adh_query'),
-          'api_key': args.get('api_key'),
-          'days': args.get('days'),
-          'type': 'adh',
-        })
+    handler = self._ACTIONS.get(_action)
+    if not handler:
+      return f'ERROR!\nUnknown action {_action}'
 
-      else:
-        if args.get('runner'):
-          hour = args.get('hour') if args.get('hour') else '1'
-          action = 'run'
-          topic = 'report-runner'
-        else:
-          hour = '*'
-          action = 'fetch'
-          topic = 'report2bq-trigger'
-
-        if args.get('profile'):
-          product = 'cm'
-          _type = 'cm'
-          _attrs.update({
-            'profile': args.get('profile'),
-            'cm_id': args.get('report_id'),
-            'type': 'cm',
-          })
-        else:
-          product = 'dv360'
-          _type = 'dv360'
-          _attrs.update({
-            'dv360_id': args.get('report_id'),
-            'type': 'dv360',
-          })
-
-      name = f"{action}-{product}-{args.get('report_id')}"
-      schedule = f"{minute} {hour} * * *"
-
-      job = { 
-        'description': args.get('description'),
-        'timeZone': args.get('timezone') or 'UTC',
-        'api_key': args.get('api_key'),
-        'name': name,
-        'schedule': schedule,
-        'topic': topic,
-        'attributes': _attrs,
-      }
+    if _action in self._JOB_ACTIONS and not args.get('job_id'):
+      error = {'error': {'message': 'No job_id given'}}
+      return (False, error) if _action == 'get' else self._status(False, error)
+
+    _credentials = self._get_credentials(email=_email, project=_project)
+    _location = self._resolve_location(_credentials, _project, args.get('location'))
+
+    kwargs = {
+      'credentials': _credentials,
+      'project': _project,
+      'location': _location,
+    }
+    return handler(self, args, kwargs)
+
+
+  def _do_list(self, args: Dict[str, Any], kwargs: Dict[str, Any]):
+    if args.get('html', True):
+      jobs = self.list_jobs(email=args.get('email'), fields=self._HTML_LIST_FIELDS, **kwargs)
+      return ''.join(
+        f"{job['name']}: {job.get('description') or 'No description.'}<br/>" for job in jobs)
+    else:
+      return self.list_jobs(email=args.get('email'), **kwargs)
+
+
+  def _do_get(self, args: Dict[str, Any], kwargs: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+    (success, job) = self.get_job(job_id=args.get('job_id'), **kwargs)
+    return success, job
+
+
+  def _do_delete(self, args: Dict[str, Any], kwargs: Dict[str, Any]) -> str:
+    (success, error) = self.delete_job(job_id=args.get('job_id'), **kwargs)
+    return self._status(success, error)
+
+
+  def _toggle(self, args: Dict[str, Any], kwargs: Dict[str, Any], enable: bool) -> str:
+    (success, error) = self.enable_job(job_id=args.get('job_id'), enable=enable, **kwargs)
+    return self._status(success, error)
 
-      self.create_job(
-        credentials=_credentials, 
-        project=_project,
-        location=_location,
-        job=job)
 
+  def _do_create(self, args: Dict[str, Any], kwargs: Dict[str, Any]) -> None:
+    self.create_job(job=self._job_definition(args), **kwargs)
 
-  def list_locations(self, credentials: Credentials=None, project: str=None):
-    service = DiscoverService.get_service(Service.SCHEDULER, credentials, api_key=os.environ['API_KEY'])
+
+  def _status(self, success: bool, error: Dict[str, Any]) -> str:
+    if success:
+      return 'OK'
+    else:
+      return f'ERROR!\n{error["error"]["message"]}'
+
+
+  # Partial response mask for the HTML listing: just what's displayed, plus
+  # the owner's email for filtering
+  _HTML_LIST_FIELDS = 'jobs(name,description,pubsubTarget/attributes/email),nextPageToken'
+
+  _ACTIONS = {
+    'list': _do_list,
+    'get': _do_get,
+    'delete': _do_delete,
+    'enable': lambda self, args, kwargs: self._toggle(args, kwargs, True),
+    'disable': lambda self, args, kwargs: self._toggle(args, kwargs, False),
+    'create': _do_create,
+  }
+
+  # Most sub-requests Google's batch endpoint takes in one call
+  _BATCH_SIZE = 1000
+
+  # Actions that work on a single, existing job
+  _JOB_ACTIONS = { 'get', 'delete', 'enable', 'disable' }
+
+
+  # Job settings per product. The first entry whose key is present in the
+  # 'create' arguments wins; 'attributes' maps pubsub attribute name to the
+  # argument it is taken from. CM and DV360 reports take their action from
+  # _REPORT_ACTIONS, depending on whether it's a runner or a fetcher.
+  _PRODUCTS = (
+    ('sa360_url', {
+      'product': 'sa360',
+      'hour': '3',
+      'action': 'fetch',
+      'topic': 'report2bq-trigger',
+      'attributes': { 'sa360_url': 'sa360_url' },
+    }),
+    ('sa360_id', {
+      'product': Type.SA360_RPT.value,
+      'hour': '*',
+      'action': 'run',
+      'topic': 'report-runner',
+      'report_id': 'sa360_id',
+      'attributes': { 'report_id': 'sa360_id' },
+    }),
+    ('adh_customer', {
+      'product': 'adh',
+      'hour': '2',
+      'action': 'run',
+      'topic': 'report2bq-trigger',
+      'attributes': {
+        'adh_customer': 'adh_customer',
+        'adh_query': 'adh_query',
+        'api_key': 'api_key',
+        'days': 'days',
+      },
+    }),
+    ('profile', {
+      'product': 'cm',
+      'attributes': { 'profile': 'profile', 'cm_id': 'report_id' },
+    }),
+    (None, {
+      'product': 'dv360',
+      'attributes': { 'dv360_id': 'report_id' },
+    }),
+  )
+
+  # Fetchers always run hourly, so have no default hour to override
+  _REPORT_ACTIONS = {
+    True: { 'hour': '1', 'action': 'run', 'topic': 'report-runner' },
+    False: { 'hour': None, 'action': 'fetch', 'topic': 'report2bq-trigger' },
+  }
+
+
+  def _job_definition(self, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a job definition
+
+    Turns the arguments for a 'create' into the job definition expected by
+    'create_job'.
+
+    Arguments:
+        args {Dict[str, Any]} -- the 'create' arguments
+
+    Returns:
+        Dict[str, Any] -- the job definition
+    """
+    _attrs = {
+      'email': args.get('email'),
+      'project': args.get('project'),
+      'force': str(args.get('force')),
+      'infer_schema': str(args.get('infer_schema')),
+      'append': str(args.get('append')),
+    }
+
+    minute = args.get('minute') or random.randrange(0, 60)
+
+    for key, product in self._PRODUCTS:
+      if not key or args.get(key):
+        break
+
+    if 'action' not in product:
+      product = {**product, **self._REPORT_ACTIONS[bool(args.get('runner'))]}
+
+    if product['hour']:
+      hour = args.get('hour') or product['hour']
+    else:
+      hour = '*'
+
+    _attrs.update({ attr: args.get(arg) for attr, arg in product['attributes'].items() })
+    _attrs['type'] = product['product']
+
+    action = product['action']
+    topic = product['topic']
+    name = f"{action}-{product['product']}-{args.get(product.get('report_id', 'report_id'))}"
+    schedule = f"{minute} {hour} * * *"
+
+    job = { 
+      'description': args.get('description'),
+      'timeZone': args.get('timezone') or 'UTC',
+      'api_key': args.get('api_key'),
+      'name': name,
+      'schedule': schedule,
+      'topic': topic,
+      'attributes': _attrs,
+    }
+
+    return job
+
+
+  def list_locations(self, credentials: Credentials=None, project: str=None) -> List[str]:
+    if project not in self._locations_cache:
+      self._locations_cache[project] = \
+        self._list_locations_with_service(self._svc(credentials), project)
+
+    return self._locations_cache[project]
+
+
+  def _list_locations_with_service(self, service: Resource, project: str) -> List[str]:
     locations_response = self.fetch(
       method=service.projects().locations().list,
-      **{'name': Scheduler.project_path(project)}
+      **{'name': project_path(project)}
     )
-    locations = list([ location['locationId'] for location in locations_response['locations'] ])
+    return [ location['locationId'] for location in locations_response['locations'] ]
+
+
+  def _resolve_location(self, credentials: Credentials=None, project: str=None, location: str=None) -> str:
+    return location or self.list_locations(credentials=credentials, project=project)[-1]
 
-    return locations
 
+  def invalidate_locations(self, project: str=None) -> None:
+    """Drop cached locations
 
-  def list_jobs(self, credentials: Credentials=None, project: str=None, location: str=None, email: str=None) -> List[Dict[str, Any]]:
-    """[summary]
+    Forget the cached location list for a project (or all projects) so the
+    next call to 'list_locations' goes back to the API.
 
-    Args:
-        credentials (Credentials, optional): [description]. Defaults to None.
-        project (str, optional): [description]. Defaults to None.
-        location (str, optional): [description]. Defaults to None.
-        email (str, optional): [description]. Defaults to None.
+    Keyword Arguments:
+        project {str} -- project identifier (default: {None}, all projects)
+    """
+    if project:
+      self._locations_cache.pop(project, None)
+    else:
+      self._locations_cache.clear()
+
+
+  def list_jobs(self, credentials: Credentials=None, project: str=None, location: str=None, email: str=None, fields: str=None) -> List[Dict[str, Any]]:
+    """List the scheduled jobs
+
+    Pages through the jobs in the project's location. If an email is given,
+    only that user's jobs are kept; this is done as each page arrives rather
+    than over the whole list at the end.
+
+    Keyword Arguments:
+        credentials {Credentials} -- credentials to use (default: {None})
+        project {str} -- project identifier (default: {None})
+        location {str} -- scheduler location (default: {None}, the last one listed)
+        email {str} -- only return jobs owned by this user (default: {None})
+        fields {str} -- partial response field mask; this must include
+                        'nextPageToken' and, if filtering by email, the job's
+                        'pubsubTarget/attributes/email' (default: {None}, everything)
 
     Returns:
-        List[Dict[str, Any]]: [description]
+        List[Dict[str, Any]] -- the jobs
     """
-    service = DiscoverService.get_service(Service.SCHEDULER, credentials, api_key=os.environ['API_KEY'])
     token = None
-    method = service.projects().locations().jobs().list
+    method = self._jobs(credentials).list
     jobs = []
 
-    if not location:
-      locations = self.list_locations(credentials=credentials, project=project)
-      location = locations[-1]
+    location = self._resolve_location(credentials, project, location)
+    parent = location_path(project, location)
 
     while True:
       _kwargs = {
-        'parent': scheduler.CloudSchedulerClient.location_path(project, location),
+        'parent': parent,
         'pageToken': token
       }
+      if fields:
+        _kwargs['fields'] = fields
 
       _jobs = self.fetch(method, **_kwargs)
-      jobs.extend(_jobs['jobs'] if 'jobs' in _jobs else [])
+      page = _jobs.get('jobs', [])
+      if email:
+        jobs.extend([
+          job for job in page
+          if job.get('pubsubTarget', {}).get('attributes', {}).get('email', '') == email
+        ])
+      else:
+        jobs.extend(page)
 
       if 'nextPageToken' not in _jobs:
         break
 
       token = _jobs['nextPageToken']
 
-    if email and jobs:
-      jobs = filter(
-        lambda j: j.get('pubsubTarget', {}).get('attributes', {}).get('email', '') == email,
-        jobs
-      )
-    
-    return list(jobs)
+    return jobs
 
 
   def delete_job(self, job_id: str=None, credentials: Credentials=None, project: str=None, location: str=None) -> Tuple[bool, Dict[str, Any]]:
-    service = DiscoverService.get_service(Service.SCHEDULER, credentials, api_key=os.environ['API_KEY'])
-    method = service.projects().locations().jobs().delete
-    if not location:
-      locations = self.list_locations(credentials=credentials, project=project)
-      location = locations[-1]
+    method = self._jobs(credentials).delete
+    location = self._resolve_location(credentials, project, location)
 
     try:
-      method(name=scheduler.CloudSchedulerClient.job_path(project=project, location=location, job=job_id)).execute()
+      method(name=job_path(project=project, location=location, job=job_id)).execute()
       return (True, None)
 
     except HttpError as error:
+      if error.resp.status == 404:
+        self.invalidate_locations(project)
       e = json.loads(error.content)
       return (False, e)
 
 
   def get_job(self, job_id: str=None, credentials: Credentials=None, project: str=None, location: str=None) -> Tuple[bool, Dict[str, Any]]:
-    service = DiscoverService.get_service(Service.SCHEDULER, credentials, api_key=os.environ['API_KEY'])
-    method = service.projects().locations().jobs().get
-    if not location:
-      locations = self.list_locations(credentials=credentials, project=project)
-      location = locations[-1]
+    method = self._jobs(credentials).get
+    location = self._resolve_location(credentials, project, location)
 
     try:
-      job = method(name=scheduler.CloudSchedulerClient.job_path(project=project, location=location, job=job_id)).execute()
+      job = method(name=job_path(project=project, location=location, job=job_id)).execute()
       return (True, job)
 
     except HttpError as error:
+      if error.resp.status == 404:
+        self.invalidate_locations(project)
       e = json.loads(error.content)
       return (False, e)
 
@@ -312,44 +413,49 @@ class Scheduler(Fetcher):
     location: str=None,
     enable: bool=True
     ) -> Tuple[bool, Dict[str, Any]]:
-    service = DiscoverService.get_service(Service.SCHEDULER, credentials, api_key=os.environ['API_KEY'])
-    if not location:
-      locations = self.list_locations(credentials=credentials, project=project)
-      location = locations[-1]
+    location = self._resolve_location(credentials, project, location)
 
     if enable:
-      method = service.projects().locations().jobs().resume
+      method = self._jobs(credentials).resume
     else:
-      method = service.projects().locations().jobs().pause
+      method = self._jobs(credentials).pause
 
     try:
-      method(name=scheduler.CloudSchedulerClient.job_path(project=project, location=location, job=job_id)).execute()
+      method(name=job_path(project=project, location=location, job=job_id)).execute()
       return (True, None)
 
     except HttpError as error:
+      if error.resp.status == 404:
+        self.invalidate_locations(project)
       e = json.loads(error.content)
       return (False, e)
 
 
   def create_job(self, credentials: Credentials=None, project: str=None, location: str=None, job: Dict[str, Any]=None):
-    service = DiscoverService.get_service(Service.SCHEDULER, credentials, api_key=os.environ['API_KEY'])
-    _method = service.projects().locations().jobs().create
+    self._create_request(
+      credentials=credentials, project=project, location=location, job=job).execute()
+
 
-    if not location:
-      locations = self.list_locations(credentials=credentials, project=project)
-      location = locations[-1]
+  def _create_request(self, credentials: Credentials=None, project: str=None, location: str=None, job: Dict[str, Any]=None) -> HttpRequest:
+    _method = self._jobs(credentials).create
 
-    _parent = scheduler.CloudSchedulerClient.location_path(project=project, location=location)
+    location = self._resolve_location(credentials, project, location)
+
+    _parent = location_path(project=project, location=location)
+    # Both 'fetch' and 'run' jobs go via Pub/Sub: the scheduler returns as
+    # soon as the message is published, so the Cloud Functions subscribed to
+    # the topic ('report2bq-trigger', 'report-runner') aren't bound by the
+    # scheduler's HTTP target deadline.
     _target = {
       'topicName': f"projects/{project}/topics/{job.get('topic', '')}",
       # 'data': base64.b64encode(b'RUN'),
       'attributes': job.get('attributes', ''),
     }
     body: dict = {
-      "name": scheduler.CloudSchedulerClient.job_path(project=project, location=location, job=job.get('name', '')),
+      "name": job_path(project=project, location=location, job=job.get('name', '')),
       "description": job.get('description', ''),
       "schedule": job.get('schedule', ''),
-      "timeZone": job.get('timezone', ''),
+      "timeZone": job.get('timeZone', ''),
       'pubsubTarget': _target
     }
 
@@ -357,24 +463,119 @@ class Scheduler(Fetcher):
       'parent': _parent,
       'body': body
     }
-    request = _method(**_args)
-    request.execute()
+    return _method(**_args)
+
+
+  def process_batch(self, args_list: List[Dict[str, Any]]) -> List[str]:
+    """Run many job changes at once
+
+    Takes a list of 'process' style arguments ('create', 'delete', 'enable'
+    and 'disable' only) and sends them to the API as batch requests, one per
+    project/user pair (split into _BATCH_SIZE chunks), rather than one HTTP
+    call per job. If a group fails outright, its entries all get the error.
+
+    Arguments:
+        args_list {List[Dict[str, Any]]} -- the arguments for each job
 
+    Returns:
+        List[str] -- 'OK' or 'ERROR!...' for each entry, in the order given
+    """
+    results = [None] * len(args_list)
+    groups: Dict[Tuple[str, str], List[int]] = {}
+    for i, args in enumerate(args_list):
+      _action = args.get('action')
+      if _action not in ('create', 'delete', 'enable', 'disable'):
+        results[i] = f"ERROR!\nUnsupported batch action {_action}"
+      elif _action in self._JOB_ACTIONS and not args.get('job_id'):
+        results[i] = self._status(False, {'error': {'message': 'No job_id given'}})
+      else:
+        groups.setdefault((args.get('project'), args.get('email')), []).append(i)
+
+    def _callback(request_id: str, response: Dict[str, Any], exception: HttpError) -> None:
+      i = int(request_id)
+      if exception:
+        if exception.resp.status == 404:
+          self.invalidate_locations(args_list[i].get('project'))
+        results[i] = f'ERROR!\n{self._error_message(exception)}'
+      else:
+        results[i] = 'OK'
+
+    for (_project, _email), indices in groups.items():
+      try:
+        _credentials = self._get_credentials(email=_email, project=_project)
+        jobs = self._jobs(_credentials)
+
+        for chunk in range(0, len(indices), self._BATCH_SIZE):
+          batch = self._svc(_credentials).new_batch_http_request(callback=_callback)
+
+          for i in indices[chunk:chunk + self._BATCH_SIZE]:
+            args = args_list[i]
+            _action = args.get('action')
+            _location = self._resolve_location(_credentials, _project, args.get('location'))
+            if _action == 'create':
+              request = self._create_request(
+                credentials=_credentials,
+                project=_project,
+                location=_location,
+                job=self._job_definition(args))
+            else:
+              name = job_path(project=_project, location=_location, job=args.get('job_id'))
+              if _action == 'delete':
+                request = jobs.delete(name=name)
+              elif _action == 'enable':
+                request = jobs.resume(name=name)
+              else:
+                request = jobs.pause(name=name)
+
+            batch.add(request, request_id=str(i))
+
+          batch.execute()
+
+      except HttpError as error:
+        if error.resp.status == 404:
+          self.invalidate_locations(_project)
+        message = f'ERROR!\n{self._error_message(error)}'
+        for i in indices:
+          if results[i] is None:
+            results[i] = message
+
+    return results
+
+
+  def _error_message(self, error: HttpError) -> str:
+    try:
+      return json.loads(error.content)['error']['message']
+
+    except (ValueError, KeyError, TypeError):
+      return str(error)
 
-  @classmethod
-  def job_path(cls, project, location, job):
-      """Return a fully-qualified job string."""
-      return f"projects/{project}/locations/{location}/jobs/{job}"
 
+  def process_many(self, args_list: List[Dict[str, Any]], max_concurrent: int=20) -> List[Any]:
+    """Run many 'process' calls concurrently
 
-  @classmethod
-  def location_path(cls, project, location):
-      """Return a fully-qualified location string."""
-      return f"projects/{project}/locations/{location}"
+    For mixed operations that 'process_batch' can't take, this runs each
+    set of arguments through 'process' on a pool of at most 'max_concurrent'
+    threads so the API round trips overlap. Discovery services aren't thread
+    safe, so each worker thread gets its own Scheduler; they all share this
+    one's location cache.
+
+    Arguments:
+        args_list {List[Dict[str, Any]]} -- the arguments for each call
+
+    Keyword Arguments:
+        max_concurrent {int} -- maximum calls in flight at once (default: {20})
+
+    Returns:
+        List[Any] -- the result of each 'process' call, in the order given
+    """
+    local = threading.local()
 
+    def _process(args: Dict[str, Any]) -> Any:
+      if not hasattr(local, 'scheduler'):
+        local.scheduler = type(self)()
+        local.scheduler._locations_cache = self._locations_cache
 
-  @classmethod
-  def project_path(cls, project):
-      """Return a fully-qualified project string."""
-      return f"projects/{project}"
+      return local.scheduler.process(args)
 
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+      return list(executor.map(_process, args_list))
@@ -25,16 +25,37 @@ is accessed via gfile and used to authenticate an https connection.
 
 import json
 import logging
+import threading
 
 from typing import Any, Dict, List, Tuple, Mapping
 from classes.services import Service
 
 from apiclient import discovery
-from oauth2client.client import AccessTokenCredentials
+from google_auth_httplib2 import AuthorizedHttp
 from classes.credentials import Credentials
 from classes.decorators import timeit, measure_memory
 
 class DiscoverService(object):
+  _local = threading.local()
+
+  @classmethod
+  def _http(cls) -> discovery.httplib2.Http:
+    """Per-thread shared transport.
+
+    httplib2 keeps its connections open per host, so handing the same Http
+    to every service built on this thread lets them share TCP/TLS sessions
+    rather than each opening its own. It's wrapped in an AuthorizedHttp per
+    service, which leaves the underlying Http untouched.
+
+    Returns:
+      http: the thread's Http object
+    """
+    if not hasattr(cls._local, 'http'):
+      cls._local.http = discovery.httplib2.Http()
+
+    return cls._local.http
+
+
   @classmethod
   def get_unknown_service(cls, credentials: Credentials, **kwargs: Mapping[str, Any]):
     """Fetch a discoverable API service.
@@ -48,10 +69,7 @@ class DiscoverService(object):
     Returns:
       service: a service for REST calls
     """
-    credentials.get_credentials()
-    _credentials = AccessTokenCredentials(credentials.token_details['access_token'], user_agent='report2bq')
-    https = discovery.httplib2.Http()
-    auth_https = _credentials.authorize(https)
+    https = AuthorizedHttp(credentials.get_credentials(), http=cls._http())
     service = discovery.build(http=https, cache_discovery=False, **kwargs)
     return service
 
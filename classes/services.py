@@ -19,9 +19,41 @@ __author__ = [
 ]
 
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Dict
 
 
+# Discovery API name and version for each service. This lives outside
+# 'Service', as a dict in an Enum's body would become a member; callers
+# get a copy from 'definition', so can't alter the shared entries.
+_DEFINITIONS = MappingProxyType({
+  'scheduler': {
+    'serviceName': 'cloudscheduler',
+    'version': 'v1',
+  },
+  'cm': {
+    'serviceName': 'dfareporting',
+    'version': 'v3.3',
+  },
+  'dv360': {
+    'serviceName': 'doubleclickbidmanager',
+    'version': 'v1.1'
+  },
+  'sa360': {
+    'serviceName': 'doubleclicksearch',
+    'version': 'v2'
+  },
+  'adh': {
+    'serviceName': 'AdsDataHub',
+    'version': 'v1'
+  },
+  'gmail': {
+    'serviceName': 'gmail',
+    'version': 'v1'
+  }
+})
+
+
 class Service(Enum):
   SCHEDULER = 'scheduler'
   DV360 = 'dv360'
@@ -35,31 +67,4 @@ class Service(Enum):
 
 
   def definition(self) -> Dict[str, Any]:
-    defs = {
-      'scheduler': {
-        'serviceName': 'cloudscheduler',
-        'version': 'v1',
-      },
-      'cm': {
-        'serviceName': 'dfareporting',
-        'version': 'v3.3',
-      },
-      'dv360': {
-        'serviceName': 'doubleclickbidmanager',
-        'version': 'v1.1'
-      },
-      'sa360': {
-        'serviceName': 'doubleclicksearch',
-        'version': 'v2'
-      },
-      'adh': {
-        'serviceName': 'AdsDataHub',
-        'version': 'v1'
-      },
-      'gmail': {
-        'serviceName': 'gmail',
-        'version': 'v1'
-      }
-    }
-    return defs.get(self.value, {})
-
+    return dict(_DEFINITIONS.get(self.value, {}))